@@ -37,7 +37,7 @@ class MainWindow(QMainWindow):
         self.serial_thread = None
         self.plot_widgets = []
         self.data_lines = []
-        self.hover_texts = []
+        self.hover_text = None
         self.is_synchronizing_x = False
         self.sample_interval_s = 0.001
         self.start_time = None  # 全局开始时间
@@ -45,6 +45,13 @@ class MainWindow(QMainWindow):
 
         self.test_data_timer = QTimer(self) # 新增测试数据定时器
 
+        # 数字矩阵刷新节流：触摸时间先写入缓存，由单次定时器统一刷新到标签
+        self._pending_digital_matrix = {}
+        self.digital_matrix_flush_timer = QTimer(self)
+        self.digital_matrix_flush_timer.setSingleShot(True)
+        self.digital_matrix_flush_timer.setInterval(33) # 约30Hz
+        self.digital_matrix_flush_timer.timeout.connect(self._flush_digital_matrix)
+
         self._init_ui() # 初始化用户界面
 
         # 创建 PlotManager 实例
@@ -57,9 +64,9 @@ class MainWindow(QMainWindow):
             self.test_data_button,
             self.status_bar,
             self.test_data_timer,
-            self.pixel_labels, # 将 pixel_labels 传递给 PlotManager
+            self.pixel_map, # 将 pixel_map 传递给 PlotManager
             self.frequency_spinbox, # 将 frequency spinbox 传递给 PlotManager
-            self.digital_matrix_labels # 将 digital matrix labels 传递给 PlotManager
+            self.digital_matrix # 将数字矩阵控件传递给 PlotManager
         )
 
         # 创建 SerialManager 实例
@@ -79,7 +86,8 @@ class MainWindow(QMainWindow):
         # 连接 SerialManager 信号
         # 使用QueuedConnection确保跨线程通信安全
         self.serial_manager.status_changed.connect(self.update_status_bar, QtCore.Qt.QueuedConnection)
-        self.serial_manager.data_received.connect(self.plot_manager.update_plots, QtCore.Qt.QueuedConnection)
+        # 数据由 SerialManager 在 GUI 线程中定时批量取出，直接连接即可在同一次定时器回调中处理完
+        self.serial_manager.data_received.connect(self.plot_manager.update_plots)
 
         # 连接 PlotManager 信号以更新像素地图
         self.plot_manager.update_pixel_map_signal.connect(self.update_pixel_map, QtCore.Qt.QueuedConnection)
@@ -88,16 +96,11 @@ class MainWindow(QMainWindow):
 
 
         # 从 SerialManager 调用 populate_serial_ports
-        # 将所有图表控件的 X 轴链接到第一个图表，以实现同步
-        if self.plot_widgets:
-            first_view_box = self.plot_widgets[0].getViewBox() # 获取第一个图表的 ViewBox
-            for i in range(1, len(self.plot_widgets)):
-                self.plot_widgets[i].getViewBox().setXLink(first_view_box) # 链接 X 轴
+        # 所有图表的 X 轴已在 create_data_display_area 中用 setXLink 链接到第一个图表，由 pyqtgraph 负责同步
 
-        # 使用专用的槽创建器连接鼠标移动信号
-        for plot_widget in self.plot_widgets:
-             plot_index = self.plot_widgets.index(plot_widget) # 获取图表索引
-             plot_widget.scene().sigMouseMoved.connect(self._create_mouse_moved_slot(plot_widget, plot_index)) # 连接鼠标移动信号
+        # 所有图表在同一个场景中，只需连接一次鼠标移动信号
+        if self.plot_widgets:
+            self.plot_widgets[0].scene().sigMouseMoved.connect(self._on_plots_mouse_moved) # 连接鼠标移动信号
 
         # 连接控制面板按钮信号
         self.connect_button.clicked.connect(self.serial_manager.connect_serial) # 连接连接按钮信号
@@ -154,16 +157,16 @@ class MainWindow(QMainWindow):
         # 将数据显示组件分配给实例属性
         self.plot_widgets = data_display_components['plot_widgets']
         self.data_lines = data_display_components['data_lines']
-        self.hover_texts = data_display_components['hover_texts']
+        self.hover_text = data_display_components['hover_text']
 
         # --- 像素地图 --- #
         pixel_map_components = create_pixel_map_area(self) # 创建像素地图区域
         main_layout.addWidget(pixel_map_components['pixel_map_widget'], 1) # 添加像素地图区域到主布局，占据较少空间
 
         # 将像素地图组件分配给实例属性
-        self.pixel_labels = pixel_map_components['pixel_labels']
+        self.pixel_map = pixel_map_components['pixel_map']
         self.clear_map_button = pixel_map_components['clear_map_button'] # 获取清空地图按钮
-        self.digital_matrix_labels = pixel_map_components['digital_matrix_labels'] # 获取数字矩阵标签
+        self.digital_matrix = pixel_map_components['digital_matrix'] # 获取数字矩阵控件
 
 
         # --- 菜单栏 --- #
@@ -174,16 +177,13 @@ class MainWindow(QMainWindow):
         # --- 状态栏 --- #
         self.status_bar = create_status_bar(self) # 创建状态栏
 
-        # 连接清空地图按钮信号
-        self.clear_map_button.clicked.connect(self.clear_pixel_map) # 连接清空像素地图信号
-
     def update_pixel_map(self, row, col):
         """根据触摸的行和列更新像素地图显示。"""
         # 仅在高亮显示检测到有效触摸时更新
         if 0 <= row < 4 and 0 <= col < 4:
             # 重置之前高亮的像素（可选，取决于所需行为）
             # 目前，我们只高亮新的像素。
-            self.pixel_labels[row][col].setStyleSheet("background-color: lightblue; border: none;") # 设置高亮样式
+            self.pixel_map.set_pixel(row, col) # 设置高亮
         elif row == -1 and col == -1:
             # 如果接收到 -1, -1，则清除所有像素
             self.clear_pixel_map() # 调用清空像素地图函数
@@ -191,23 +191,34 @@ class MainWindow(QMainWindow):
 
     def clear_pixel_map(self):
         """清除像素地图显示和数字矩阵。"""
-        for row in range(4):
-            for col in range(4):
-                self.pixel_labels[row][col].setStyleSheet("background-color: lightgray; border: none;") # 重置为默认样式
-                self.digital_matrix_labels[row][col].setText("0.000") # 清空数字矩阵文本
+        # 丢弃尚未刷新的触摸时间，避免之后覆盖清空结果
+        self.digital_matrix_flush_timer.stop()
+        self._pending_digital_matrix.clear()
+        self.pixel_map.clear() # 重置为默认颜色
+        self.digital_matrix.clear() # 清空数字矩阵文本
 
 
     def update_digital_matrix(self, row, col, time_s):
         """使用触摸时间更新数字矩阵显示。"""
         if 0 <= row < 4 and 0 <= col < 4:
-            self.digital_matrix_labels[row][col].setText(f"{time_s:.3f}") # 设置数字矩阵文本
+            self._pending_digital_matrix[(row, col)] = time_s # 记录最新触摸时间
+            if not self.digital_matrix_flush_timer.isActive():
+                self.digital_matrix_flush_timer.start()
+
+
+    def _flush_digital_matrix(self):
+        """将缓存的最新触摸时间一次性刷新到数字矩阵。"""
+        for (row, col), time_s in self._pending_digital_matrix.items():
+            self.digital_matrix.set_value(row, col, time_s) # 设置数字矩阵文本
+        self._pending_digital_matrix.clear()
 
 
-    def _create_mouse_moved_slot(self, plot_widget, plot_index):
-        """为每个图表创建鼠标移动槽函数。"""
-        def mouse_moved_slot(pos):
-            self.plot_manager._mouse_moved_on_plot(pos, plot_widget, plot_index) # 调用 PlotManager 中的处理函数
-        return mouse_moved_slot # 返回槽函数
+    def _on_plots_mouse_moved(self, pos):
+        """图表场景中鼠标移动时，交给鼠标所在的图表处理。"""
+        for plot_index, plot_widget in enumerate(self.plot_widgets):
+            if plot_widget.sceneBoundingRect().contains(pos):
+                self.plot_manager._mouse_moved_on_plot(pos, plot_widget, plot_index) # 调用 PlotManager 中的处理函数
+                break
 
     def update_status_bar(self, message):
         """更新状态栏消息。"""
@@ -11,7 +11,7 @@ class DataManager(QObject):
     """数据管理器，负责处理双缓存数据存储和更新"""
     
     # 定义信号
-    data_updated = pyqtSignal(list, float)  # 数据更新信号
+    data_updated = pyqtSignal(object, float)  # 数据更新信号 (values 可为 list 或 tuple)
     
     def __init__(self):
         super().__init__()
@@ -5,7 +5,11 @@
 #
 
 import time
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+LABEL_FLUSH_INTERVAL_MS = 33  # 标签刷新间隔（约30Hz）
+VOLTAGE_PREFIXES = tuple(f"CH{i+1}: " for i in range(8))  # 电压标签的通道前缀，预先生成
+VOLTAGE_SUFFIX = " V"  # 电压标签的单位后缀
 
 class PlotUpdater(QObject):
     """图表更新器，负责实时更新图表显示"""
@@ -25,6 +29,13 @@ class PlotUpdater(QObject):
         self._update_frequency_limit = 0.05  # 20Hz更新频率限制
         self._last_data_cache = {}
         
+        # 标签刷新节流：最新文本先写入缓存，由单次定时器统一刷新到标签
+        self._pending_voltage_texts = [None] * 8
+        self._label_flush_timer = QTimer(self)
+        self._label_flush_timer.setSingleShot(True)
+        self._label_flush_timer.setInterval(LABEL_FLUSH_INTERVAL_MS)
+        self._label_flush_timer.timeout.connect(self._flush_voltage_labels)
+        
     def set_components(self, plot_widgets, data_lines, voltage_labels):
         """设置图表组件
         
@@ -85,16 +96,30 @@ class PlotUpdater(QObject):
             values: 8个通道的电压值列表
             is_active: 是否为活跃状态（影响显示格式）
         """
+        pending = self._pending_voltage_texts
         for i in range(min(8, len(self.voltage_labels), len(values))):
             voltage = values[i]
-            if is_active:
-                self.voltage_labels[i].setText(f"CH{i+1}: {voltage:.3f} V")
-            else:
-                self.voltage_labels[i].setText(f"CH{i+1}: {voltage:.3f} V")
+            pending[i] = VOLTAGE_PREFIXES[i] + format(voltage, '.3f') + VOLTAGE_SUFFIX
             
             # 发出电压更新信号
             self.voltage_updated.emit(i, voltage)
             
+        self._schedule_label_flush()
+            
+    def _schedule_label_flush(self):
+        """启动标签刷新定时器，合并定时器周期内的多次更新，只刷新最新的文本"""
+        if not self._label_flush_timer.isActive():
+            self._label_flush_timer.start()
+            
+    def _flush_voltage_labels(self):
+        """将缓存的最新电压文本一次性刷新到标签"""
+        pending = self._pending_voltage_texts
+        for i in range(min(8, len(self.voltage_labels))):
+            text = pending[i]
+            if text is not None:
+                self.voltage_labels[i].setText(text)
+                pending[i] = None
+            
     def update_voltage_labels_from_mouse(self, mouse_x, data_manager):
         """根据鼠标位置更新电压标签（显示插值电压）
         
@@ -112,14 +137,19 @@ class PlotUpdater(QObject):
             else:
                 voltage_strings[ch_idx] = "--- V"
                 
-        # 更新所有电压标签
+        # 写入待刷新文本，与实时数据共用同一个刷新定时器
+        pending = self._pending_voltage_texts
         for ch_idx in range(min(8, len(self.voltage_labels))):
-            self.voltage_labels[ch_idx].setText(f"CH{ch_idx+1}: {voltage_strings[ch_idx]}")
+            pending[ch_idx] = VOLTAGE_PREFIXES[ch_idx] + voltage_strings[ch_idx]
+        self._schedule_label_flush()
             
     def reset_voltage_labels(self):
         """重置电压标签为默认值"""
+        # 丢弃尚未刷新的文本，避免之后覆盖默认值
+        self._label_flush_timer.stop()
+        self._pending_voltage_texts = [None] * 8
         for i in range(min(8, len(self.voltage_labels))):
-            self.voltage_labels[i].setText(f"CH{i+1}: 0.000 V")
+            self.voltage_labels[i].setText(VOLTAGE_PREFIXES[i] + "0.000" + VOLTAGE_SUFFIX)
             
     def clear_all_plots(self):
         """清除所有图表数据"""
@@ -34,7 +34,7 @@ class PlotManager(QObject):
     
     def __init__(self, main_window, plot_widgets, data_lines, voltage_labels, 
                  sample_interval_s, test_data_button, status_bar, test_data_timer, 
-                 pixel_labels, frequency_spinbox, digital_matrix_labels):
+                 pixel_map, frequency_spinbox, digital_matrix):
         super().__init__()
         
         # 保存主要组件引用
@@ -46,9 +46,9 @@ class PlotManager(QObject):
         self.test_data_button = test_data_button
         self.status_bar = status_bar
         self.test_data_timer = test_data_timer
-        self.pixel_labels = pixel_labels
+        self.pixel_map = pixel_map
         self.frequency_spinbox = frequency_spinbox
-        self.digital_matrix_labels = digital_matrix_labels
+        self.digital_matrix = digital_matrix
         self.duration_spinbox = None
         
         # 初始化各个功能模块
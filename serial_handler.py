@@ -3,18 +3,85 @@
 # 文件功能说明:
 # 该文件包含 SerialThread 类，负责在单独的线程中处理串口通信。
 # 它负责连接到指定的串口，以设定的波特率和其他参数接收数据，
-# 解析接收到的数据帧，并发出信号通知主线程数据已接收。
+# 解析接收到的数据帧，并放入输出队列供主线程定时取出。
 # 它还提供列出可用串口的功能。
 #
 
 import serial
 import serial.tools.list_ports
 from PyQt5.QtCore import QThread, pyqtSignal
+import collections
 import struct
 import time
 
+FRAME_TAIL = bytes([0x00, 0x00, 0x80, 0x7f]) # 数据帧尾
+FRAME_DATA_LENGTH = 32 # 数据长度（8个小端 float）
+FRAME_LENGTH = FRAME_DATA_LENGTH + len(FRAME_TAIL) # 完整数据帧长度(32字节数据+4字节帧尾)
+MAX_BUFFER_SIZE = FRAME_LENGTH * 10 # 未找到帧尾时允许的最大缓冲区大小
+OUT_QUEUE_SIZE = 4096 # 输出队列容量，GUI 线程来不及取出时丢弃最旧的数据帧
+READ_CHUNK_SIZE = 4096 # 单次读取的最大字节数
+READ_TIMEOUT = 0.01 # 读取超时时间（秒），同时作为线程检查停止标志的周期
+INTER_BYTE_TIMEOUT = 0.001 # 字节间隔超时的下限（秒），一段连续数据到达后尽快返回
+INTER_BYTE_CHARS = 3 # 字节间隔超时按几个字符时间计算
+BITS_PER_CHAR = 11 # 每个字符的最大位数（起始位 + 8数据位 + 校验位 + 停止位）
+_FRAME_STRUCT = struct.Struct('<8f') # 一次解码8个浮点数
+
+def inter_byte_timeout(baudrate):
+    """根据波特率计算字节间隔超时（秒）。
+
+    取几个字符的传输时间，并以 INTER_BYTE_TIMEOUT 为下限，
+    避免低波特率下（9600 约 1.15 ms/字符）每收到一个字节就返回一次。
+    """
+    return max(INTER_BYTE_TIMEOUT, INTER_BYTE_CHARS * BITS_PER_CHAR / baudrate)
+
+def parse_frames(buffer):
+    """扫描缓冲区中的帧尾并解码所有完整数据帧。
+
+    扫描和解码都在局部变量上完成，不修改 buffer，由调用方删除已处理的数据。
+
+    Args:
+        buffer: 接收缓冲区 (bytearray)
+
+    Returns:
+        tuple: (frames, consumed)，frames 为解码得到的8通道数值元组列表，
+               consumed 为可从缓冲区头部删除的字节数
+    """
+    frames = []
+    find = buffer.find
+    unpack_from = _FRAME_STRUCT.unpack_from
+    tail = FRAME_TAIL
+    tail_length = len(tail)
+    buffer_length = len(buffer)
+    pos = 0
+
+    while buffer_length - pos >= FRAME_LENGTH:
+        # 查找帧尾（find 未找到时返回 -1，不触发异常）
+        tail_index = find(tail, pos)
+        if tail_index < 0:
+            # 没有找到帧尾，检查缓冲区是否过大
+            if buffer_length - pos > MAX_BUFFER_SIZE:
+                pos = buffer_length - FRAME_LENGTH # 保留最后可能的部分帧
+            break
+
+        # 检查帧尾位置是否合理
+        if tail_index - pos < FRAME_DATA_LENGTH:
+            # 帧尾位置不正确，丢弃错误数据
+            pos = tail_index + tail_length
+            continue
+
+        # 解析8个浮点数值
+        # 帧尾前至少有32字节数据，unpack_from 不会因长度不足而失败，无需 try/except
+        frames.append(unpack_from(buffer, tail_index - FRAME_DATA_LENGTH))
+        pos = tail_index + tail_length
+
+    return frames, pos
+
 class SerialThread(QThread):
-    data_received = pyqtSignal(list) # 接收到数据时发出的信号
+    """串口读取线程。
+
+    解码得到的数据帧以 (values, relative_time) 的形式追加到 out_queue，
+    由 GUI 线程定时批量取出，避免每帧一个跨线程信号挤占 Qt 事件队列。
+    """
     status_changed = pyqtSignal(str) # 串口状态改变时发出的信号
 
     def __init__(self, port, baudrate, stopbits, databits, parity, flowcontrol, start_time_with_offset=None):
@@ -27,8 +94,10 @@ class SerialThread(QThread):
         self.flowcontrol = flowcontrol
         self.serial_port = None
         self.running = False
-        self.data_frame_tail = bytes([0x00, 0x00, 0x80, 0x7f])
+        self.data_frame_tail = FRAME_TAIL
         self.buffer = bytearray()
+        # deque 的 append/popleft 在 GIL 下是原子操作，可在线程间安全使用
+        self.out_queue = collections.deque(maxlen=OUT_QUEUE_SIZE)
         self.start_time = time.time() # 线程启动时的实际时间
         # 计算初始时间偏移量
         self.time_offset = 0.0
@@ -45,7 +114,8 @@ class SerialThread(QThread):
                 bytesize=self.databits,
                 parity=self.parity,
                 stopbits=self.stopbits,
-                timeout=1,      # 读取超时时间
+                timeout=READ_TIMEOUT,      # 读取超时时间
+                inter_byte_timeout=inter_byte_timeout(self.baudrate), # 字节间隔超时时间（按波特率计算）
                 write_timeout=2, # 写入超时时间
                 rtscts=self.flowcontrol == 'RTS/CTS',
                 xonxoff=self.flowcontrol == 'XON/XOFF'
@@ -69,18 +139,16 @@ class SerialThread(QThread):
             # 主循环
             while self.running:
                 try:
-                    # 非阻塞读取
-                    if self.serial_port.in_waiting > 0:
-                        data_byte = self.serial_port.read(self.serial_port.in_waiting)
-                        if data_byte:  # 确保有数据
-                            self.buffer.extend(data_byte)
-                            self.process_buffer()
-                    
-                    # 更合理的休眠时间
-                    time.sleep(0.01)  # 10ms休眠
+                    # 一次阻塞读取，超时或字节间隔超时后返回这段时间内收到的数据，
+                    # 代替 in_waiting 查询 + read + sleep 的轮询
+                    data_byte = self.serial_port.read(READ_CHUNK_SIZE)
+                    if data_byte:  # 确保有数据
+                        self.buffer.extend(data_byte)
+                        self.process_buffer()
                     
                 except serial.SerialException as e:
-                    self.status_changed.emit(f"串口读取错误: {e}")
+                    if self.running: # stop() 取消读取引发的异常属于正常退出
+                        self.status_changed.emit(f"串口读取错误: {e}")
                     break
 
         except serial.SerialException as e:
@@ -94,51 +162,27 @@ class SerialThread(QThread):
 
     def process_buffer(self):
         """处理接收缓冲区中的数据，提取有效数据帧"""
-        frame_length = 36  # 完整数据帧长度(32字节数据+4字节帧尾)
-        max_buffer_size = frame_length * 10  # 最大缓冲区大小
-        
         try:
-            while len(self.buffer) >= frame_length:
-                # 查找帧尾
-                try:
-                    tail_index = self.buffer.index(self.data_frame_tail)
-                except ValueError:
-                    # 没有找到帧尾，检查缓冲区是否过大
-                    if len(self.buffer) > max_buffer_size:
-                        self.buffer = self.buffer[-frame_length:]  # 保留最后可能的部分帧
-                    break
-                
-                # 检查帧尾位置是否合理
-                if tail_index < 32:
-                    # 帧尾位置不正确，丢弃错误数据
-                    self.buffer = self.buffer[tail_index + len(self.data_frame_tail):]
-                    continue
-                
-                # 提取有效数据帧
-                frame_start = tail_index - 32
-                frame_data = self.buffer[frame_start:tail_index]
+            frames, consumed = parse_frames(self.buffer)
+            
+            # 移除已处理的数据
+            if consumed:
+                del self.buffer[:consumed]
                 
-                # 解析8个浮点数值
-                values = []
-                try:
-                    for i in range(8):
-                        value_bytes = frame_data[i*4:(i+1)*4]
-                        value = struct.unpack('<f', value_bytes)[0]
-                        values.append(value)
-                except struct.error:
-                    # 数据解析错误，丢弃该帧
-                    self.buffer = self.buffer[tail_index + len(self.data_frame_tail):]
-                    continue
+            if not frames:
+                return
                 
+            # 循环不变量绑定为局部变量，避免每帧重复查找属性
+            now = time.time
+            append = self.out_queue.append
+            time_base = self.time_offset - self.start_time # 相对时间 = 当前时间 - 开始时间 + 偏移量
+            
+            for values in frames:
                 # 计算相对时间，加上偏移量
-                current_time = time.time()
-                relative_time = (current_time - self.start_time) + self.time_offset
+                relative_time = now() + time_base
 
-                # 发送有效数据
-                self.data_received.emit([values, relative_time])
-                
-                # 移除已处理的数据
-                self.buffer = self.buffer[tail_index + len(self.data_frame_tail):]
+                # 放入输出队列，由 GUI 线程取出
+                append((values, relative_time))
                 
         except Exception as e:
             # 捕获所有处理异常，防止线程崩溃
@@ -153,28 +197,16 @@ class SerialThread(QThread):
         if self.start_time is not None:
             self.time_offset = time.time() - self.start_time
             
-        # 安全关闭串口
+        # 取消正在进行的读取，让读取线程尽快退出并在 run() 的 finally 中关闭串口，
+        # 避免 GUI 线程在读取过程中关闭串口
         if self.serial_port and self.serial_port.is_open:
             try:
-                # 先取消读取操作
                 self.serial_port.cancel_read()
-                # 设置超时关闭
-                self.serial_port.timeout = 0.1
-                self.serial_port.write_timeout = 0.1
-                # 尝试关闭串口
-                self.serial_port.close()
             except Exception as e:
-                print(f"关闭串口时出错: {e}")
-            finally:
-                # 确保串口被关闭
-                if hasattr(self.serial_port, '_port_handle'):
-                    try:
-                        self.serial_port._port_handle = None
-                    except:
-                        pass
-                    
+                print(f"取消读取时出错: {e}")
+
         # 等待线程结束，但设置超时
-        self.wait(2000)  # 最多等待2秒
+        return self.wait(2000)  # 最多等待2秒，返回线程是否已结束
 
 def list_available_ports():
     """列出系统中所有可用的串口。"""
@@ -10,9 +10,31 @@ import time
 import serial
 import serial.tools.list_ports
 from PyQt5.QtWidgets import QComboBox, QPushButton, QMessageBox, QStatusBar
-from PyQt5.QtCore import pyqtSignal, QObject
+from PyQt5.QtCore import pyqtSignal, QObject, QTimer
 from serial_handler import SerialThread # 假设 SerialThread 在 serial_handler.py 中
-from ui.serial_utils import populate_serial_ports # 导入 populate_serial_ports
+from ui.serial_utils import populate_serial_ports, refresh_serial_ports_async, update_port_combo # 导入串口列表辅助函数
+
+DRAIN_INTERVAL_MS = 16 # 从串口线程输出队列取数据的间隔（约60Hz）
+
+# 下拉框文本到 pyserial 常量的映射
+_STOPBITS = {
+    "1": serial.STOPBITS_ONE,
+    "1.5": serial.STOPBITS_ONE_POINT_FIVE,
+    "2": serial.STOPBITS_TWO,
+}
+_DATABITS = {
+    "5": serial.FIVEBITS,
+    "6": serial.SIXBITS,
+    "7": serial.SEVENBITS,
+    "8": serial.EIGHTBITS,
+}
+_PARITY = {
+    "None": serial.PARITY_NONE,
+    "Even": serial.PARITY_EVEN,
+    "Odd": serial.PARITY_ODD,
+    "Mark": serial.PARITY_MARK,
+    "Space": serial.PARITY_SPACE,
+}
 
 class SerialManager(QObject):
     # 定义将连接到 MainWindow 的信号
@@ -32,6 +54,10 @@ class SerialManager(QObject):
         self.status_bar = status_bar
         self.main_window = main_window  # 保存MainWindow引用
         self.serial_thread = None
+        # 定时从串口线程的输出队列中批量取出数据帧
+        self.drain_timer = QTimer(self)
+        self.drain_timer.setInterval(DRAIN_INTERVAL_MS)
+        self.drain_timer.timeout.connect(self._drain_serial_queue)
         populate_serial_ports(self.port_combo) # 调用导入的 populate_serial_ports 函数
 
     def connect_serial(self):
@@ -43,35 +69,10 @@ class SerialManager(QObject):
 
         baudrate = int(self.baud_combo.currentText()) # 获取选定的波特率
 
-        stopbits_str = self.stopbits_combo.currentText() # 获取选定的停止位字符串
-        if stopbits_str == "1":
-            stopbits = serial.STOPBITS_ONE
-        elif stopbits_str == "1.5":
-            stopbits = serial.STOPBITS_ONE_POINT_FIVE
-        else: # "2"
-            stopbits = serial.STOPBITS_TWO
-
-        databits_str = self.databits_combo.currentText() # 获取选定的数据位字符串
-        if databits_str == "5":
-            databits = serial.FIVEBITS
-        elif databits_str == "6":
-            databits = serial.SIXBITS
-        elif databits_str == "7":
-            databits = serial.SEVENBITS
-        else: # "8"
-            databits = serial.EIGHTBITS
-
-        parity_str = self.parity_combo.currentText() # 获取选定的奇偶校验字符串
-        if parity_str == "None":
-            parity = serial.PARITY_NONE
-        elif parity_str == "Even":
-            parity = serial.PARITY_EVEN
-        elif parity_str == "Odd":
-            parity = serial.PARITY_ODD
-        elif parity_str == "Mark":
-            parity = serial.PARITY_MARK
-        else: # "Space"
-            parity = serial.PARITY_SPACE
+        # 将下拉框文本映射为 pyserial 常量
+        stopbits = _STOPBITS.get(self.stopbits_combo.currentText(), serial.STOPBITS_TWO) # 获取选定的停止位
+        databits = _DATABITS.get(self.databits_combo.currentText(), serial.EIGHTBITS) # 获取选定的数据位
+        parity = _PARITY.get(self.parity_combo.currentText(), serial.PARITY_SPACE) # 获取选定的奇偶校验
 
         flowcontrol = self.flow_control_combo.currentText() # 获取选定的流控制方式
 
@@ -89,9 +90,10 @@ class SerialManager(QObject):
             flowcontrol,
             start_time_with_offset  # 传递带有偏移的时间基准
         )
-        self.serial_thread.data_received.connect(self.data_received.emit) # 连接数据接收信号
         self.serial_thread.status_changed.connect(self.status_changed.emit) # 连接状态改变信号
+        self.serial_thread.finished.connect(self._on_serial_thread_finished) # 线程自行退出时停止取数据
         self.serial_thread.start() # 启动线程
+        self.drain_timer.start() # 开始定时取出数据
 
         # 更新 UI 控件状态
         self.connect_button.setEnabled(False)
@@ -114,19 +116,17 @@ class SerialManager(QObject):
                 if self.main_window and hasattr(self.serial_thread, 'time_offset'):
                     self.main_window.last_time_offset = self.serial_thread.time_offset
                 
-                # 停止线程并设置超时
-                self.serial_thread.stop()
-                
-                # 使用超时等待线程结束
-                if not self.serial_thread.wait(2000):  # 最多等待2秒
+                # 停止线程并等待其结束，串口由读取线程自行关闭
+                if not self.serial_thread.stop():  # 最多等待2秒
                     self.serial_thread.terminate()  # 强制终止线程
+                    self.serial_thread.wait()
                     self.status_changed.emit("警告：串口线程强制终止") # 发出警告信号
-                
-                # 确保串口已关闭
-                if hasattr(self.serial_thread, 'serial_port') and self.serial_thread.serial_port:
-                    if self.serial_thread.serial_port.is_open:
+
+                    # 线程被强制终止时 finally 不会执行，在这里关闭串口
+                    serial_port = self.serial_thread.serial_port
+                    if serial_port and serial_port.is_open:
                         try:
-                            self.serial_thread.serial_port.close()
+                            serial_port.close()
                         except Exception as e:
                             print(f"关闭串口时出错: {e}")
             
@@ -134,6 +134,10 @@ class SerialManager(QObject):
                 print(f"断开串口时出错: {e}")
                 self.status_changed.emit(f"断开串口时出错: {e}")
 
+        # 线程可能已自行退出（打开失败、读取异常、设备拔出），无论如何都停止定时器并取出剩余数据
+        self.drain_timer.stop()
+        self._drain_serial_queue()
+
         # 更新 UI 控件状态
         self.connect_button.setEnabled(True)
         self.disconnect_button.setEnabled(False)
@@ -143,8 +147,38 @@ class SerialManager(QObject):
         self.databits_combo.setEnabled(True)
         self.parity_combo.setEnabled(True)
         self.flow_control_combo.setEnabled(True)
+        refresh_serial_ports_async(self.port_combo, self._on_ports_scanned) # 在后台重新枚举串口，以便发现新插入的设备
         self.status_changed.emit("串口已断开") # 发出状态改变信号
 
+    def _on_ports_scanned(self, ports):
+        """后台串口枚举完成后更新端口下拉框。
+
+        枚举结果可能在用户重新连接之后才返回，连接期间不修改下拉框的选项和启用状态。
+        """
+        if self.is_connected():
+            return
+        update_port_combo(self.port_combo, ports)
+        self.port_combo.setEnabled(bool(ports)) # 没有可用串口时禁用下拉框
+
+    def _on_serial_thread_finished(self):
+        """串口线程结束时（包括打开失败、读取异常等自行退出的情况）停止定时器并取出剩余数据。"""
+        if self.sender() is not self.serial_thread:
+            return # 旧线程的结束信号，已在断开时处理
+        self.drain_timer.stop()
+        self._drain_serial_queue()
+
+    def _drain_serial_queue(self):
+        """取出串口线程输出队列中的所有数据帧，并在 GUI 线程中逐帧转发。"""
+        if self.serial_thread is None:
+            return
+            
+        queue = self.serial_thread.out_queue
+        popleft = queue.popleft
+        emit = self.data_received.emit
+        while queue:
+            values, relative_time = popleft()
+            emit([values, relative_time])
+
     def is_connected(self):
         """检查串口是否已连接。"""
         return self.serial_thread is not None and self.serial_thread.isRunning() # 返回连接状态
\ No newline at end of file
@@ -5,42 +5,104 @@
 #
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QComboBox, QSpinBox
-from ui.utils import get_font
+from ui.utils import get_font, CHANNEL_CSS
+
+# 控制面板的样式表，导入时生成一次，在控制面板上统一设置，按对象名匹配控件
+# 电压标签颜色与图表曲线一致
+CONTROL_PANEL_QSS = "\n".join(
+    [f"QLabel#chLabel{i} {{ font-family: Consolas, Courier New, monospace; font-size: 14pt; color: {css}; }}"
+     for i, css in enumerate(CHANNEL_CSS)]
+    + ["QLabel#serialParamsLabel { color: #1E90FF; }"]
+)
+
+# 协议与连接配置表：(字段名, 标签文本, 选项列表, 默认选项)
+PROTOCOL_FIELDS = (
+    ('data_engine', "数据引擎", ["JustFloat"], "JustFloat"),
+    ('data_interface', "数据接口", ["串口"], "串口"),
+)
+
+# 串口参数配置表：(字段名, 网格行号, 标签文本, 选项列表, 默认选项)
+SERIAL_FIELDS = (
+    ('port', 0, "端口号", None, None),
+    ('baud', 2, "波特率", ["9600", "19200", "38400", "57600", "115200"], "115200"),
+    ('flow_control', 3, "数据流控", ["None", "RTS/CTS", "XON/XOFF"], "None"),
+    ('parity', 4, "校验位", ["None", "Even", "Odd", "Mark", "Space"], "None"),
+    ('databits', 5, "数据位数", ["5", "6", "7", "8"], "8"),
+    ('stopbits', 6, "停止位数", ["1", "1.5", "2"], "1"),
+)
+
+def _create_labeled_combo(text, items, default, font):
+    """创建参数标签和对应的下拉框。
+
+    Args:
+        text: 标签文本
+        items: 下拉框选项，为 None 时不添加选项
+        default: 默认选中的选项
+        font: 标签和下拉框使用的字体
+
+    Returns:
+        (QLabel, QComboBox) 元组
+    """
+    label = QLabel(text) # 参数标签
+    label.setFont(font) # 设置字体
+    combo = QComboBox() # 参数下拉框
+    if items:
+        combo.addItems(items) # 添加选项
+        combo.setCurrentText(default) # 设置当前文本
+    combo.setFont(font) # 设置字体
+    combo.setMinimumHeight(40) # 设置最小高度
+    return label, combo
+
+def _add_combo_row(grid_layout, row, text, items, default, font):
+    """在网格布局的一行中添加标签和下拉框。
+
+    Args:
+        grid_layout: 目标网格布局
+        row: 网格行号
+        text, items, default, font: 同 _create_labeled_combo
+
+    Returns:
+        创建的 QComboBox
+    """
+    label, combo = _create_labeled_combo(text, items, default, font)
+    grid_layout.addWidget(label, row, 0) # 添加标签到布局
+    grid_layout.addWidget(combo, row, 1) # 添加下拉框到布局
+    return combo
 
 def create_control_panel(parent):
     """创建控制面板区域。"""
     control_panel = QWidget()
+    control_panel.setUpdatesEnabled(False) # 构建期间暂停更新，避免每次添加控件都触发布局和重绘
     control_layout = QVBoxLayout(control_panel)
     control_panel.setFixedWidth(400) # 设置固定宽度
     control_layout.setSpacing(15) # 设置控件间距
     control_layout.setContentsMargins(15, 15, 15, 15) # 设置边距
 
-    label_font = get_font(14) # 标签字体
-    button_font = get_font(14) # 按钮字体
+    label_font = button_font = get_font(14) # 标签和按钮共用同一个字体对象
+    title_font = get_font(18, bold=True) # 分组标题字体
 
     # --- 实时电压显示区域 ---
     voltage_display_group = QWidget()
     voltage_display_group_layout = QVBoxLayout(voltage_display_group)
 
     voltage_title = QLabel("实时电压值") # 实时电压值标题
-    voltage_title.setFont(get_font(18, bold=True)) # 设置标题字体
+    voltage_title.setFont(title_font) # 设置标题字体
     voltage_display_group_layout.addWidget(voltage_title) # 添加标题
 
-    voltage_labels = [] # 电压标签列表
+    voltage_labels = [None] * 8 # 电压标签列表，按通道索引填充
     for i in range(8):
         label = QLabel(f"CH{i+1}: 0.000 V") # 创建通道标签
-        color = f"color: rgb({i*30 % 255}, {i*50 % 255}, {i*70 % 255})" # 根据通道索引设置颜色
-        label.setStyleSheet(f"font-family: Consolas, Courier New, monospace; font-size: 14pt; {color}") # 设置样式
+        label.setObjectName(f"chLabel{i}") # 对象名，样式由 CONTROL_PANEL_QSS 按通道设置
         voltage_display_group_layout.addWidget(label) # 添加标签
-        voltage_labels.append(label) # 将标签添加到列表
+        voltage_labels[i] = label # 将标签放入列表
     voltage_display_group_layout.addStretch() # 添加伸展空间
     control_layout.addWidget(voltage_display_group) # 添加电压显示组
 
     # --- 协议与连接 ---
     protocol_connection_label = QLabel("协议与连接") # 协议与连接标签
-    protocol_connection_label.setFont(get_font(18, bold=True)) # 设置字体
+    protocol_connection_label.setFont(title_font) # 设置字体
     test_data_control_label = QLabel("测试数据控制") # 测试数据控制标签
-    test_data_control_label.setFont(get_font(18, bold=True)) # 设置字体
+    test_data_control_label.setFont(title_font) # 设置字体
     control_layout.addWidget(test_data_control_label) # 添加测试数据控制标签
 
     frequency_label = QLabel("频率 (Hz)") # 频率标签
@@ -66,39 +128,23 @@ def create_control_panel(parent):
 
     control_layout.addWidget(protocol_connection_label) # 添加协议与连接标签
 
-    # --- 数据引擎 ---
-    data_engine_layout = QHBoxLayout() # 数据引擎水平布局
-    data_engine_label = QLabel("数据引擎") # 数据引擎标签
-    data_engine_label.setFont(label_font) # 设置字体
-    data_engine_combo = QComboBox() # 数据引擎下拉框
-    data_engine_combo.addItems(["JustFloat"]) # 添加选项
-    data_engine_combo.setCurrentText("JustFloat") # 设置当前文本
-    data_engine_combo.setFont(label_font) # 设置字体
-
-    data_engine_combo.setMinimumHeight(40) # 设置最小高度
-    data_engine_layout.addWidget(data_engine_label) # 添加标签
-    data_engine_layout.addStretch() # 添加伸展空间
-    data_engine_layout.addWidget(data_engine_combo) # 添加下拉框
-    control_layout.addLayout(data_engine_layout) # 添加布局
-
-    # --- 数据接口 ---
-    data_interface_layout = QHBoxLayout() # 数据接口水平布局
-    data_interface_label = QLabel("数据接口") # 数据接口标签
-    data_interface_label.setFont(label_font) # 设置字体
-    data_interface_combo = QComboBox() # 数据接口下拉框
-    data_interface_combo.addItems(["串口"]) # 添加选项
-    data_interface_combo.setCurrentText("串口") # 设置当前文本
-    data_interface_combo.setFont(label_font) # 设置字体
-    data_interface_combo.setMinimumHeight(40) # 设置最小高度
-    data_interface_layout.addWidget(data_interface_label) # 添加标签
-    data_interface_layout.addStretch() # 添加伸展空间
-    data_interface_layout.addWidget(data_interface_combo) # 添加下拉框
-    control_layout.addLayout(data_interface_layout) # 添加布局
+    # --- 数据引擎 / 数据接口 ---
+    protocol_combos = {} # 按字段名保存协议与连接下拉框
+    for name, text, items, default in PROTOCOL_FIELDS:
+        label, combo = _create_labeled_combo(text, items, default, label_font)
+        row_layout = QHBoxLayout() # 标签靠左、下拉框靠右的水平布局
+        row_layout.addWidget(label) # 添加标签
+        row_layout.addStretch() # 添加伸展空间
+        row_layout.addWidget(combo) # 添加下拉框
+        control_layout.addLayout(row_layout) # 添加布局
+        protocol_combos[name] = combo
+    data_engine_combo = protocol_combos['data_engine'] # 数据引擎下拉框
+    data_interface_combo = protocol_combos['data_interface'] # 数据接口下拉框
 
     # --- 串口参数配置 ---
     serial_params_label = QLabel("串口参数配置") # 串口参数配置标签
     serial_params_label.setFont(get_font(16, bold=True)) # 设置字体
-    serial_params_label.setStyleSheet("color: #1E90FF;") # 设置样式
+    serial_params_label.setObjectName("serialParamsLabel") # 对象名，样式由 CONTROL_PANEL_QSS 设置
     control_layout.addWidget(serial_params_label) # 添加标签
 
 
@@ -106,65 +152,15 @@ def create_control_panel(parent):
     serial_layout = QGridLayout(serial_group) # 串口参数网格布局
     serial_layout.setSpacing(8) # 设置间距
 
-    port_label = QLabel("端口号") # 端口号标签
-    port_label.setFont(label_font) # 设置字体
-    serial_layout.addWidget(port_label, 0, 0) # 添加标签到布局
-    port_combo = QComboBox() # 端口号下拉框
-    port_combo.setFont(label_font) # 设置字体
-    port_combo.setMinimumHeight(40) # 设置最小高度
-    serial_layout.addWidget(port_combo, 0, 1) # 添加下拉框到布局
-
-    baud_label = QLabel("波特率") # 波特率标签
-    baud_label.setFont(label_font) # 设置字体
-    serial_layout.addWidget(baud_label, 2, 0) # 添加标签到布局
-    baud_combo = QComboBox() # 波特率下拉框
-    baud_combo.addItems(["9600", "19200", "38400", "57600", "115200"]) # 添加选项
-    baud_combo.setCurrentText("115200") # 设置当前文本
-    baud_combo.setFont(label_font) # 设置字体
-    baud_combo.setMinimumHeight(40) # 设置最小高度
-    serial_layout.addWidget(baud_combo, 2, 1) # 添加下拉框到布局
-
-    flow_control_label = QLabel("数据流控") # 数据流控标签
-    flow_control_label.setFont(label_font) # 设置字体
-    serial_layout.addWidget(flow_control_label, 3, 0) # 添加标签到布局
-    flow_control_combo = QComboBox() # 数据流控下拉框
-    flow_control_combo.addItems(["None", "RTS/CTS", "XON/XOFF"]) # 添加选项
-
-    flow_control_combo.setCurrentText("None") # 设置当前文本
-    flow_control_combo.setFont(label_font) # 设置字体
-    flow_control_combo.setMinimumHeight(40) # 设置最小高度
-    serial_layout.addWidget(flow_control_combo, 3, 1) # 添加下拉框到布局
-
-    parity_label = QLabel("校验位") # 校验位标签
-    parity_label.setFont(label_font) # 设置字体
-    serial_layout.addWidget(parity_label, 4, 0) # 添加标签到布局
-    parity_combo = QComboBox() # 校验位下拉框
-    parity_combo.addItems(["None", "Even", "Odd", "Mark", "Space"]) # 添加选项
-    parity_combo.setCurrentText("None") # 设置当前文本
-    parity_combo.setFont(label_font) # 设置字体
-    parity_combo.setMinimumHeight(40) # 设置最小高度
-    serial_layout.addWidget(parity_combo, 4, 1) # 添加下拉框到布局
-
-    databits_label = QLabel("数据位数") # 数据位数标签
-    databits_label.setFont(label_font) # 设置字体
-    serial_layout.addWidget(databits_label, 5, 0) # 添加标签到布局
-    databits_combo = QComboBox() # 数据位数下拉框
-    databits_combo.addItems(["5", "6", "7", "8"]) # 添加选项
-    databits_combo.setCurrentText("8") # 设置当前文本
-    databits_combo.setFont(label_font) # 设置字体
-    databits_combo.setMinimumHeight(40) # 设置最小高度
-    serial_layout.addWidget(databits_combo, 5, 1) # 添加下拉框到布局
-
-    stopbits_label = QLabel("停止位数") # 停止位数标签
-
-    stopbits_label.setFont(label_font) # 设置字体
-    serial_layout.addWidget(stopbits_label, 6, 0) # 添加标签到布局
-    stopbits_combo = QComboBox() # 停止位数下拉框
-    stopbits_combo.addItems(["1", "1.5", "2"]) # 添加选项
-    stopbits_combo.setCurrentText("1") # 设置当前文本
-    stopbits_combo.setFont(label_font) # 设置字体
-    stopbits_combo.setMinimumHeight(40) # 设置最小高度
-    serial_layout.addWidget(stopbits_combo, 6, 1) # 添加下拉框到布局
+    serial_combos = {} # 按字段名保存串口参数下拉框
+    for name, row, text, items, default in SERIAL_FIELDS:
+        serial_combos[name] = _add_combo_row(serial_layout, row, text, items, default, label_font)
+    port_combo = serial_combos['port'] # 端口号下拉框，选项由串口扫描填充
+    baud_combo = serial_combos['baud'] # 波特率下拉框
+    flow_control_combo = serial_combos['flow_control'] # 数据流控下拉框
+    parity_combo = serial_combos['parity'] # 校验位下拉框
+    databits_combo = serial_combos['databits'] # 数据位数下拉框
+    stopbits_combo = serial_combos['stopbits'] # 停止位数下拉框
 
     control_layout.addWidget(serial_group) # 添加串口参数分组
 
@@ -206,6 +202,10 @@ def create_control_panel(parent):
     control_layout.addLayout(action_buttons_layout) # 添加操作按钮布局
     control_layout.addStretch() # 添加伸展空间
 
+    control_panel.setStyleSheet(CONTROL_PANEL_QSS) # 一次性设置全部子控件的样式
+    control_panel.setUpdatesEnabled(True) # 构建完成后恢复更新
+    control_panel.updateGeometry() # 统一进行一次布局
+
     return {
         'control_panel': control_panel,
         'voltage_labels': voltage_labels,
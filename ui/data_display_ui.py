@@ -4,74 +4,82 @@
 # 该文件包含用于创建数据显示区域（包括图表）用户界面的函数。
 #
 
-from PyQt5.QtWidgets import QWidget, QGridLayout, QVBoxLayout
-from PyQt5.QtCore import Qt
 import pyqtgraph as pg
+from ui.utils import CHANNEL_QCOLORS
 
-def create_data_display_area(parent):
-    """创建数据显示区域，包含图表。"""
-    data_display_area = QWidget() # 数据显示区域
-    data_display_layout = QGridLayout(data_display_area) # 数据显示网格布局
-
-    plot_widgets = [] # 图表控件列表
-    data_lines = [] # 数据线条列表
-    hover_texts = [] # 悬停文本列表
+# 实时曲线关闭抗锯齿以降低绘制开销
+pg.setConfigOptions(antialias=False, background='w', foreground='k')
 
-    for i in range(8): # 创建 8 个图表
-        if i < 4:
-            row = i
-            col = 0
-        else:
-            row = i - 4
-            col = 1
+# 各通道曲线共享的画笔，导入时生成一次
+CHANNEL_PENS = tuple(
+    pg.mkPen(color=color, width=2, cosmetic=True)
+    for color in CHANNEL_QCOLORS
+)
 
-        plot_widget_container = QWidget() # 图表容器
-        plot_layout = QVBoxLayout(plot_widget_container) # 图表容器布局
-        plot_layout.setContentsMargins(10,10,10,10) # 设置边距
+def _setup_plot_widget(plot_widget, title, show_time_axis):
+    """设置单个图表（PlotItem）的标题、坐标轴和视图范围。
 
-        plot_widget = pg.PlotWidget() # 创建 PlotWidget
-        plot_widget.setBackground('w') # 设置背景颜色
-        plot_widget.setTitle(f"CH{i+1}" if i < 4 else f"CH{i+1}") # 设置图表标题
-        plot_widget.setLabel('left', '电压 (V)', color='#000000', size='12pt') # 设置左轴标签
+    白色背景和黑色坐标轴由全局配置提供，这里只设置与默认值不同的属性，
+    视图范围相关的设置集中在同一个 ViewBox 上完成。
+    """
+    plot_widget.setTitle(title) # 设置图表标题
+    plot_widget.setLabel('left', '电压 (V)', color='#000000', size='12pt') # 设置左轴标签
+    left_axis = plot_widget.getAxis('left')
+    left_axis.enableAutoSIPrefix(False) # 单位已写在标签中，不需要根据范围计算 SI 前缀
+    left_axis.setTicks([[(v, str(v)) for v in (0, 1, 2, 3)], [(v / 10, '') for v in range(34)]]) # Y 轴范围固定，直接给出主刻度和次刻度
+    bottom_axis = plot_widget.getAxis('bottom')
+    bottom_axis.enableAutoSIPrefix(False)
+    if show_time_axis:
         plot_widget.setLabel('bottom', '时间 (s)', color='#000000', size='12pt') # 设置底轴标签
-        plot_widget.showGrid(x=False, y=False) # 显示网格
-        plot_widget.setYRange(0, 3.3) # 设置 Y 轴范围
-        plot_widget.getViewBox().setMouseEnabled(y=False) # 禁用 Y 轴鼠标交互
-        plot_widget.getViewBox().setLimits(yMin=0, yMax=3.3, xMin=0) # 设置轴限制
+    else:
+        bottom_axis.setStyle(showValues=False) # 隐藏底轴值
 
-        plot_widget.getAxis('left').setPen(color='#000000') # 设置左轴笔颜色
-        plot_widget.getAxis('bottom').setPen(color='#000000') # 设置底轴笔颜色
-        plot_widget.getAxis('left').setTextPen(color='#000000') # 设置左轴文本笔颜色
-        plot_widget.getAxis('bottom').setTextPen(color='#000000') # 设置底轴文本笔颜色
+    view_box = plot_widget.getViewBox()
+    view_box.setLimits(yMin=0, yMax=3.3, xMin=0) # 设置轴限制
+    view_box.setMouseEnabled(y=False) # 禁用 Y 轴鼠标交互
+    view_box.setYRange(0, 3.3) # 设置 Y 轴范围
+    view_box.disableAutoRange() # X/Y 范围由程序控制，实时更新时不再自动计算范围
 
-        if (i < 3) or (i > 3 and i < 7):
-            plot_widget.getAxis('bottom').setStyle(showValues=False) # 隐藏底轴值
-            plot_widget.getAxis('bottom').setLabel('') # 清空底轴标签
+def create_data_display_area(parent):
+    """创建数据显示区域，包含图表。
 
-        plot_widgets.append(plot_widget) # 添加图表到列表
-        plot_layout.addWidget(plot_widget) # 添加图表到布局
+    8 个图表作为 PlotItem 放在同一个 GraphicsLayoutWidget 中，共用一个场景和一次绘制，
+    返回的 plot_widgets 为这些 PlotItem（接口与 PlotWidget 转发的方法一致）。
+    """
+    data_display_area = pg.GraphicsLayoutWidget() # 数据显示区域（背景颜色来自全局配置）
+    data_display_area.setUpdatesEnabled(False) # 构建期间暂停更新，避免每次添加图表都触发布局和重绘
+    data_display_area.ci.layout.setContentsMargins(10, 10, 10, 10) # 设置边距
+    data_display_area.ci.layout.setSpacing(20) # 设置图表间距
 
-        hover_text = pg.TextItem(anchor=(0,1)) # 创建悬停文本项
-        plot_widget.addItem(hover_text) # 添加悬停文本项到图表
-        hover_text.hide() # 默认隐藏
-        plot_widget.hover_text_item = hover_text # 存储悬停文本项引用
-        hover_texts.append(hover_text) # 添加悬停文本项到列表
+    plot_widgets = [None] * 8 # 图表列表，按通道索引填充
+    data_lines = [None] * 8 # 数据线条列表，按通道索引填充
 
-        data_display_layout.addWidget(plot_widget_container, row, col) # 添加图表容器到数据显示布局
+    for i in range(8): # 创建 8 个图表，每列 4 个
+        plot_widget = data_display_area.addPlot(row=i % 4, col=i // 4) # 创建 PlotItem
+        _setup_plot_widget(plot_widget, f"CH{i+1}", show_time_axis=i in (3, 7)) # 只有每列最下方的图表显示时间轴
+        plot_widgets[i] = plot_widget # 将图表放入列表
 
-        # 将所有图表链接到第一个图表的 X 轴并连接信号
+        # 将所有图表链接到第一个图表的 X 轴，平移和缩放由 pyqtgraph 内部同步
         if i > 0:
             plot_widget.setXLink(plot_widgets[0]) # 链接 X 轴
-            # 连接视图范围改变信号以同步所有图表
-            plot_widget.getViewBox().sigXRangeChanged.connect(
-                lambda vb, rng, idx=i: parent.plot_manager.synchronize_x_ranges(vb, rng))
 
-        data_line = plot_widget.plot([], [], pen=pg.mkPen(color=(i*30 % 255, i*50 % 255, i*70 % 255), width=2)) # 创建数据线条
-        data_lines.append(data_line) # 添加数据线条到列表
+        data_line = plot_widget.plot([], [], pen=CHANNEL_PENS[i]) # 创建数据线条
+        data_line.curve.setSegmentedLineMode('on') # 线宽大于1时按线段批量绘制，避免逐段构建 QPainterPath
+        data_line.setClipToView(True) # 只绘制当前 X 范围内的数据
+        data_line.setDownsampling(auto=True, method='peak') # 按屏幕宽度自动降采样，保留峰值
+        data_lines[i] = data_line # 将数据线条放入列表
+
+    # 同一时刻只会显示一个悬停提示，所有图表共用一个文本项，使用时用 addItem 移到目标图表
+    hover_text = pg.TextItem(anchor=(0,1)) # 创建共享的悬停文本项
+    plot_widgets[0].addItem(hover_text) # 默认放在第一个图表中
+    hover_text.hide() # 默认隐藏
+
+    data_display_area.setUpdatesEnabled(True) # 构建完成后恢复更新
+    data_display_area.updateGeometry() # 统一进行一次布局
 
     return {
         'data_display_area': data_display_area,
         'plot_widgets': plot_widgets,
         'data_lines': data_lines,
-        'hover_texts': hover_texts
-    }
\ No newline at end of file
+        'hover_text': hover_text
+    }
@@ -4,27 +4,173 @@
 # 该文件包含用于创建像素映射和数字矩阵显示区域用户界面的函数。
 #
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QPushButton, QSizePolicy, QMessageBox, QFileDialog
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QSizePolicy, QMessageBox, QFileDialog
+from PyQt5.QtCore import Qt, QRect, QSize
+from PyQt5.QtGui import QColor, QImage, QPainter
 from ui.utils import get_font
-from PIL import Image
+try:
+    from PIL import Image # 仅导出二值图时需要，未安装时其余界面照常使用
+except ImportError:
+    Image = None
+import numpy as np
 import datetime
-
-def export_binary_image(pixel_labels, parent):
-    """导出像素映射为二值 BMP 图像。"""
-    binary_image = Image.new('1', (4, 4)) # 创建 4x4 二值图像
-    pixels = binary_image.load() # 获取像素访问对象
-
-    for row in range(4):
-        for col in range(4):
-            # 检查背景颜色以确定像素是否高亮
-            color = pixel_labels[row][col].palette().color(pixel_labels[row][col].backgroundRole())
-            # 假设 lightblue 是高亮颜色，检查其 RGB 值
-            if color.red() == 173 and color.green() == 216 and color.blue() == 230: # lightblue 的 RGB
-                 pixels[col, row] = 0 # 高亮显示为黑色
-            else:
-                 pixels[col, row] = 1 # 未高亮显示为白色
-
+import functools
+
+PIXEL_COLORS = {False: "lightgray", True: "lightblue"} # 像素单元格的默认颜色和高亮颜色
+
+class PixelMapWidget(QWidget):
+    """4x4 像素映射控件
+
+    高亮状态保存在一个 4x4 的 Format_Indexed8 QImage 中（颜色表为默认色和高亮色），
+    numpy 数组 state 直接引用图像的像素内存，绘制时由 Qt 一次性放大整张图像，
+    代替 16 个 QLabel 及其网格布局。
+    """
+
+    ROWS = 4
+    COLS = 4
+    CELL_SPACING = 1 # 单元格间距（像素）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image = QImage(self.COLS, self.ROWS, QImage.Format_Indexed8) # 每个像素对应一个单元格
+        self._image.setColorTable([QColor(PIXEL_COLORS[False]).rgb(), QColor(PIXEL_COLORS[True]).rgb()]) # 按状态索引的颜色
+        bits = self._image.bits() # 图像像素内存（宽度 4 字节，每行无填充）
+        bits.setsize(self._image.byteCount())
+        self.state = np.ndarray((self.ROWS, self.COLS), dtype=np.uint8, buffer=bits) # 高亮状态，1 表示高亮
+        self.state.fill(0)
+        policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred) # 宽度扩展，高度跟随宽度
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+
+    def sizeHint(self):
+        return QSize(256, 256)
+
+    def hasHeightForWidth(self):
+        return True
+
+    def heightForWidth(self, width):
+        """保持正方形，高度等于宽度"""
+        return width
+
+    def cell_rect(self, row, col):
+        """返回单元格在控件中的矩形区域"""
+        x0 = col * self.width() // self.COLS
+        x1 = (col + 1) * self.width() // self.COLS
+        y0 = row * self.height() // self.ROWS
+        y1 = (row + 1) * self.height() // self.ROWS
+        return QRect(x0, y0, x1 - x0 - self.CELL_SPACING, y1 - y0 - self.CELL_SPACING)
+
+    def set_pixel(self, row, col, highlighted=True):
+        """设置单元格的高亮状态，只重绘发生变化的单元格"""
+        value = 1 if highlighted else 0
+        if self.state[row, col] != value:
+            self.state[row, col] = value
+            self.update(self.cell_rect(row, col))
+
+    def clear(self):
+        """清除所有高亮"""
+        if self.state.any():
+            self.state.fill(0)
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawImage(self.rect(), self._image) # 最近邻放大，每个像素填满一个单元格
+        # 在单元格右侧和下方绘制间隔线
+        gap_color = self.palette().color(self.backgroundRole())
+        width = self.width()
+        height = self.height()
+        for col in range(1, self.COLS + 1):
+            painter.fillRect(col * width // self.COLS - self.CELL_SPACING, 0, self.CELL_SPACING, height, gap_color)
+        for row in range(1, self.ROWS + 1):
+            painter.fillRect(0, row * height // self.ROWS - self.CELL_SPACING, width, self.CELL_SPACING, gap_color)
+        painter.end()
+
+class DigitalMatrixWidget(QWidget):
+    """4x4 触摸时间显示控件
+
+    16 个时间值在同一个 paintEvent 里用 QPainter 直接绘制（边框加居中文本），
+    代替 16 个带边框的 QLabel。单元格矩形在尺寸变化时计算一次并缓存。
+    """
+
+    ROWS = 4
+    COLS = 4
+    CELL_WIDTH = 60 # 单元格宽度（像素）
+    CELL_HEIGHT = 30 # 单元格高度（像素）
+    CELL_SPACING = 5 # 单元格间距（像素）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._texts = [["0.000"] * self.COLS for _ in range(self.ROWS)] # 各单元格显示的文本，绘制时直接使用
+        self._cell_rects = [] # 缓存的单元格矩形，按行组织
+        self.setFont(get_font(10)) # 较小的字体用于数字
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True) # paintEvent 绘制全部区域，重绘前不擦除背景
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed) # 宽度随布局扩展，高度固定
+        self.setMinimumSize(self.sizeHint())
+        self._update_cell_rects()
+
+    def sizeHint(self):
+        return QSize(self.COLS * self.CELL_WIDTH + (self.COLS - 1) * self.CELL_SPACING,
+                     self.ROWS * self.CELL_HEIGHT + (self.ROWS - 1) * self.CELL_SPACING)
+
+    def _update_cell_rects(self):
+        """根据当前宽度计算每个单元格的矩形（每列等宽分配，单元格在列内水平居中）"""
+        column_width = (self.width() + self.CELL_SPACING) / self.COLS
+        self._cell_rects = [
+            [QRect(int(col * column_width + (column_width - self.CELL_SPACING - self.CELL_WIDTH) / 2),
+                   row * (self.CELL_HEIGHT + self.CELL_SPACING),
+                   self.CELL_WIDTH, self.CELL_HEIGHT)
+             for col in range(self.COLS)]
+            for row in range(self.ROWS)
+        ]
+
+    def resizeEvent(self, event):
+        self._update_cell_rects()
+        super().resizeEvent(event)
+
+    def set_value(self, row, col, time_s):
+        """设置单元格的触摸时间，只重绘该单元格"""
+        self._texts[row][col] = f"{time_s:.3f}"
+        self.update(self._cell_rects[row][col])
+
+    def set_values(self, values):
+        """一次性设置全部 4x4 触摸时间"""
+        self._texts = [[f"{value:.3f}" for value in row] for row in np.reshape(values, (self.ROWS, self.COLS))]
+        self.update()
+
+    def clear(self):
+        """将全部单元格重置为 0.000"""
+        self._texts = [["0.000"] * self.COLS for _ in range(self.ROWS)]
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().color(self.backgroundRole())) # 背景
+        painter.setPen(QColor("black")) # 边框和文本颜色
+        texts = self._texts
+        for row, row_rects in enumerate(self._cell_rects):
+            for col, rect in enumerate(row_rects):
+                painter.drawRect(rect.adjusted(0, 0, -1, -1)) # 1 像素边框
+                painter.drawText(rect, Qt.AlignCenter, texts[row][col])
+        painter.end()
+
+def export_binary_image(pixel_map, parent, checked=False):
+    """导出像素映射为二值 BMP 图像。
+
+    Args:
+        pixel_map: PixelMapWidget 实例
+        parent: 消息框的父窗口
+        checked: 按钮 clicked 信号附带的参数，未使用
+    """
+    if Image is None:
+        QMessageBox.warning(parent, "导出失败", "未安装 Pillow，无法导出二值图。请先执行 pip install Pillow") # 显示错误消息
+        return
+
+    # 高亮显示为黑色(0)，未高亮显示为白色(1)
+    # '1' 模式的原始数据每行按字节对齐、高位在前，逐行打包即可直接构建图像
+    rows, cols = pixel_map.state.shape
+    packed_bits = np.packbits(1 - pixel_map.state, axis=1) # 每行打包为 ceil(cols/8) 个字节
+    binary_image = Image.frombytes('1', (cols, rows), packed_bits.tobytes()) # 创建二值图像
 
     # 生成带当前日期和时间的文件名
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S") # 获取时间戳
@@ -36,81 +182,50 @@ def export_binary_image(pixel_labels, parent):
 def create_pixel_map_area(parent):
     """创建像素映射和数字矩阵显示区域。"""
     pixel_map_widget = QWidget() # 像素映射区域控件
+    pixel_map_widget.setUpdatesEnabled(False) # 构建期间暂停更新，避免每次添加控件都触发布局和重绘
     # 使用 QVBoxLayout 堆叠标题和网格
     main_pixel_layout = QVBoxLayout(pixel_map_widget) # 主垂直布局
     main_pixel_layout.setSpacing(5) # 设置间距
     main_pixel_layout.setContentsMargins(10, 10, 10, 10) # 设置边距
 
+    title_font = get_font(18, bold=True) # 标题字体
+    button_font = get_font(14) # 按钮字体
+
     # 添加像素映射标题
     pixel_map_title = QLabel("像素映射") # 像素映射标题
-    pixel_map_title.setFont(get_font(18, bold=True)) # 设置字体
+    pixel_map_title.setFont(title_font) # 设置字体
     pixel_map_title.setAlignment(Qt.AlignCenter) # 居中对齐
     main_pixel_layout.addWidget(pixel_map_title) # 添加标题
 
-    # 创建像素网格布局
-    pixel_map_layout = QGridLayout() # 网格布局
-    pixel_map_layout.setSpacing(1) # 减小像素间距
-    pixel_map_layout.setContentsMargins(0, 0, 0, 0) # 移除边距
-
-    pixel_labels = [] # 像素标签列表
-    for row in range(4):
-        row_labels = []
-        for col in range(4):
-            label = QLabel() # 创建标签
-            label.setStyleSheet("background-color: lightgray; border: none;") # 设置默认样式
-            label.setAlignment(Qt.AlignCenter) # 居中对齐
-            label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding) # 设置大小策略为扩展
-            pixel_map_layout.addWidget(label, row, col) # 添加标签到布局
-            row_labels.append(label) # 添加标签到行列表
-        pixel_labels.append(row_labels) # 添加行列表到像素标签列表
-
-    # 为行和列设置相等的伸展因子
-    for i in range(4):
-        pixel_map_layout.setRowStretch(i, 1)
-        pixel_map_layout.setColumnStretch(i, 1)
-
-    # 将像素网格布局添加到主 QVBoxLayout
-    main_pixel_layout.addLayout(pixel_map_layout) # 添加布局
+    # 创建像素映射控件
+    pixel_map = PixelMapWidget() # 单个控件绘制全部像素
+    main_pixel_layout.addWidget(pixel_map) # 添加像素映射控件
 
     # --- 数字矩阵显示 ---
     digital_matrix_title = QLabel("触摸时间 (s)") # 触摸时间标题
-    digital_matrix_title.setFont(get_font(18, bold=True)) # 设置字体
+    digital_matrix_title.setFont(title_font) # 设置字体
     digital_matrix_title.setAlignment(Qt.AlignCenter) # 居中对齐
     main_pixel_layout.addWidget(digital_matrix_title) # 添加标题
 
-    digital_matrix_layout = QGridLayout() # 数字矩阵网格布局
-    digital_matrix_layout.setSpacing(5) # 设置间距
-    digital_matrix_layout.setContentsMargins(0, 0, 0, 0) # 移除边距
-
-    digital_matrix_labels = [] # 数字矩阵标签列表
-    for row in range(4):
-        row_labels = []
-        for col in range(4):
-            label = QLabel("0.000") # 默认文本
-            label.setFixedSize(60, 30) # 根据需要调整大小
-            label.setAlignment(Qt.AlignCenter) # 居中对齐
-            label.setStyleSheet("border: 1px solid black;") # 添加边框以便可见
-            label.setFont(get_font(10)) # 较小的字体用于数字
-            row_labels.append(label) # 添加标签到行列表
-            digital_matrix_layout.addWidget(label, row, col) # 添加标签到布局
-        digital_matrix_labels.append(row_labels) # 添加行列表到数字矩阵标签列表
-
-    main_pixel_layout.addLayout(digital_matrix_layout) # 添加数字矩阵布局
+    digital_matrix = DigitalMatrixWidget() # 单个控件绘制全部触摸时间
+    main_pixel_layout.addWidget(digital_matrix) # 添加数字矩阵控件
 
     # 添加导出按钮
     export_button = QPushButton("导出二值图") # 导出二值图按钮
-    export_button.setFont(get_font(14)) # 设置字体
+    export_button.setFont(button_font) # 设置字体
     export_button.setMinimumHeight(48) # 设置最小高度
-    export_button.clicked.connect(lambda: export_binary_image(pixel_labels, parent)) # 连接点击信号，传递 parent
+    export_button.clicked.connect(functools.partial(export_binary_image, pixel_map, parent)) # 连接点击信号，传递 parent
 
     clear_map_button = QPushButton("清空映射") # 清空映射按钮
-    clear_map_button.setFont(get_font(14)) # 设置字体
+    clear_map_button.setFont(button_font) # 设置字体
     clear_map_button.setMinimumHeight(48) # 设置最小高度
-    clear_map_button.clicked.connect(lambda: parent.clear_pixel_map()) # 连接点击信号
+    clear_map_button.clicked.connect(parent.clear_pixel_map) # 直接连接绑定方法
 
     main_pixel_layout.addWidget(export_button) # 添加导出按钮
     main_pixel_layout.addWidget(clear_map_button) # 添加清空按钮
     main_pixel_layout.addStretch() # 添加伸展空间将网格推到顶部
 
     pixel_map_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # 允许根据布局空间调整大小
-    return {'pixel_map_widget': pixel_map_widget, 'pixel_labels': pixel_labels, 'export_button': export_button, 'clear_map_button': clear_map_button, 'digital_matrix_labels': digital_matrix_labels} # 返回相关控件和标签
\ No newline at end of file
+    pixel_map_widget.setUpdatesEnabled(True) # 构建完成后恢复更新
+    pixel_map_widget.updateGeometry() # 统一进行一次布局
+    return {'pixel_map_widget': pixel_map_widget, 'pixel_map': pixel_map, 'export_button': export_button, 'clear_map_button': clear_map_button, 'digital_matrix': digital_matrix} # 返回相关控件
\ No newline at end of file
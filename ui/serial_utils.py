@@ -4,18 +4,110 @@
 # 该文件包含用于处理串口相关的辅助函数。
 #
 
+import functools
+import sys
+import time
 from PyQt5.QtWidgets import QComboBox
+from PyQt5.QtCore import QObject, QRunnable, QSignalBlocker, QThreadPool, pyqtSignal
 import serial.tools.list_ports
 
+try:
+    from PyQt5.QtSerialPort import QSerialPortInfo # Qt 原生串口枚举（部分发行版中为单独的包）
+except ImportError:
+    QSerialPortInfo = None
+
+PORT_CACHE_TTL = 1.0 # 串口列表缓存有效期（秒）
+_PORT_CACHE = {'ts': 0.0, 'ports': None} # 上次枚举的时间和结果
+
+def _enumerate_serial_ports():
+    """枚举可用串口设备名称。
+
+    优先使用 Qt 原生的 QSerialPortInfo，不可用时退回 pyserial。
+    返回的名称与 pyserial 的 device 一致（Windows 为 COMx，其他平台为 /dev/ 路径），可直接用于打开串口。
+    """
+    if QSerialPortInfo is None:
+        return [port.device for port in serial.tools.list_ports.comports()]
+    if sys.platform.startswith('win'):
+        return [info.portName() for info in QSerialPortInfo.availablePorts()]
+    return [info.systemLocation() for info in QSerialPortInfo.availablePorts()]
+
+def list_serial_ports(max_age=PORT_CACHE_TTL):
+    """返回可用串口设备名称列表。
+
+    枚举串口是阻塞的系统调用，在缓存有效期内直接复用上次的结果。
+    """
+    now = time.monotonic()
+    if _PORT_CACHE['ports'] is None or now - _PORT_CACHE['ts'] >= max_age:
+        _PORT_CACHE['ports'] = _enumerate_serial_ports() # 获取可用串口列表
+        _PORT_CACHE['ts'] = now
+    return _PORT_CACHE['ports']
+
 # 填充可用串口到下拉框的辅助函数
 def populate_serial_ports(port_combo):
-    """填充可用串口到下拉框。"""
-    ports = serial.tools.list_ports.comports() # 获取可用串口列表
-    port_combo.clear() # 清空下拉框
-    for port in ports:
-        port_combo.addItem(port.device) # 添加串口设备名称
-    if not ports:
-        port_combo.addItem("无可用串口") # 如果没有可用串口，显示提示
-        port_combo.setEnabled(False) # 禁用下拉框
-    else:
-        port_combo.setEnabled(True) # 启用下拉框
\ No newline at end of file
+    """填充可用串口到下拉框，没有可用串口时禁用下拉框。"""
+    ports = list_serial_ports()
+    update_port_combo(port_combo, ports)
+    port_combo.setEnabled(bool(ports)) # 没有可用串口时禁用下拉框
+
+def update_port_combo(port_combo, ports):
+    """用给定的串口列表更新下拉框。
+
+    只增删发生变化的项，串口列表未变化时不触碰下拉框，并保留当前选择。
+    不修改下拉框的启用状态，启用状态由调用方（SerialManager）根据连接状态决定。
+    """
+    new_items = ports if ports else ["无可用串口"] # 如果没有可用串口，显示提示
+    old_items = [port_combo.itemText(i) for i in range(port_combo.count())]
+
+    if new_items != old_items:
+        current_text = port_combo.currentText() # 记录当前选择
+        blocker = QSignalBlocker(port_combo) # 增删过程中不发出 currentIndexChanged 等信号
+        # 倒序移除已不存在的项，避免索引偏移
+        for index in range(len(old_items) - 1, -1, -1):
+            if old_items[index] not in new_items:
+                port_combo.removeItem(index)
+        # 添加新出现的串口设备名称
+        for item in new_items:
+            if item not in old_items:
+                port_combo.addItem(item)
+        # 恢复之前的选择
+        index = port_combo.findText(current_text)
+        if index >= 0:
+            port_combo.setCurrentIndex(index)
+        blocker.unblock()
+
+class _PortScanSignals(QObject):
+    """后台串口枚举任务的信号载体（QRunnable 本身不能定义信号）"""
+    ports_ready = pyqtSignal(list) # 枚举完成信号
+
+class _PortScanTask(QRunnable):
+    """在线程池中枚举串口的任务"""
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        self.signals.ports_ready.emit(list_serial_ports())
+
+def _on_ports_ready(port_combo, on_ready, ports):
+    """后台枚举完成后在 GUI 线程中调用：清除进行中标记并交给回调处理结果"""
+    port_combo._port_scan_pending = False
+    on_ready(ports)
+
+def refresh_serial_ports_async(port_combo, on_ready=None):
+    """在线程池中枚举串口，完成后在 GUI 线程中处理结果，不阻塞界面。
+
+    上一次枚举尚未完成时忽略新的请求；有效期内的重复请求直接命中串口列表缓存。
+
+    Args:
+        port_combo: 串口下拉框，同时作为信号对象的父对象
+        on_ready: 接收串口列表的回调，默认只用 update_port_combo 更新下拉框的选项
+    """
+    if on_ready is None:
+        on_ready = functools.partial(update_port_combo, port_combo)
+    if getattr(port_combo, '_port_scan_pending', False):
+        return # 已有枚举任务在运行，结果返回后会更新下拉框
+    port_combo._port_scan_pending = True
+    signals = _PortScanSignals(port_combo) # 以下拉框为父对象，保证结果送达前不被回收
+    signals.ports_ready.connect(functools.partial(_on_ports_ready, port_combo, on_ready))
+    signals.ports_ready.connect(signals.deleteLater)
+    QThreadPool.globalInstance().start(_PortScanTask(signals))
@@ -4,11 +4,19 @@
 # 该文件包含用于 UI 组件的辅助函数。
 #
 
-from PyQt5.QtGui import QFont
+import functools
+from PyQt5.QtGui import QFont, QColor
+
+# 各通道的颜色，图表曲线和电压标签共用，导入时生成一次
+CHANNEL_COLORS = tuple((i*30 % 255, i*50 % 255, i*70 % 255) for i in range(8)) # RGB 元组
+CHANNEL_QCOLORS = tuple(QColor(*rgb) for rgb in CHANNEL_COLORS) # QColor 对象
+CHANNEL_CSS = tuple(color.name() for color in CHANNEL_QCOLORS) # 样式表颜色字符串（#rrggbb）
 
 # 获取字体的辅助函数
+# 按 (point_size, bold) 缓存，相同参数的控件共享同一个 QFont（setFont 会复制字体，共享是安全的）
+@functools.lru_cache(maxsize=32)
 def get_font(point_size, bold=False):
     font = QFont()
     font.setPointSize(point_size)
     font.setBold(bold)
-    return font
\ No newline at end of file
+    return font